@@ -0,0 +1,134 @@
+"""Mesure du temps de frame de l'ordonnanceur d'IA selon le nombre d'agents.
+
+Les agents sont simulés sans affichage: chaque frame appelle
+AgentScheduler.update() puis Group.update(), comme le ferait la boucle
+principale d'un jeu. Le benchmark vérifie que le temps consacré aux
+décisions reste plafonné par le budget de l'ordonnanceur quel que soit le
+nombre d'agents. L'interpolation des déplacements restant proportionnelle au
+nombre d'agents, il vérifie aussi que le temps de frame tient dans le budget
+d'une frame à 30 images par seconde.
+"""
+
+import math
+import random
+import statistics
+import time
+
+import pygame as pg
+
+from .scheduler import Agent, AgentScheduler
+
+# Taille du plateau simulé
+WIDTH = 630 # px
+HEIGHT = 480 # px
+
+AGENT_COUNTS = (10, 100, 1000, 5000)
+
+# Durée d'une frame à 30 images par seconde
+FRAME_BUDGET = 1 / 30 # s
+
+# Dépassement toléré du budget de décision: l'ordonnanceur ne s'arrête
+# qu'après la décision en cours et sert chaque palier au moins une fois.
+BUDGET_TOLERANCE = 0.0005 # s
+
+
+class Enemy(Agent):
+    """Représente un ennemi qui poursuit le joueur."""
+
+    # Nombre de directions évaluées à chaque décision
+    directions = 16
+
+    def think(self, player):
+        """Choisit, parmi plusieurs directions, celle qui rapproche le plus
+        l'agent du joueur.
+        """
+        best, best_distance = None, math.inf
+        for index in range(self.directions):
+            angle = 2 * math.pi * index / self.directions
+            candidate = self.position + pg.math.Vector2(
+                math.cos(angle), math.sin(angle)
+            ) * self.speed * 10
+            distance = candidate.distance_to(player)
+            if distance < best_distance:
+                best, best_distance = candidate, distance
+        self.target = best
+
+
+def run(count, frames, budget):
+    """Simule une partie avec count agents et retourne les temps de frame."""
+    random.seed(count)
+    enemies = pg.sprite.Group()
+    scheduler = AgentScheduler(budget=budget)
+    for _ in range(count):
+        enemy = Enemy((random.randrange(WIDTH), random.randrange(HEIGHT)))
+        enemies.add(enemy)
+        scheduler.add(enemy)
+
+    player = pg.math.Vector2(WIDTH / 2, HEIGHT / 2)
+    think_times, frame_times, thoughts = [], [], []
+    for frame in range(frames):
+        # Le joueur tourne autour du centre du plateau
+        player.from_polar((150, frame * 3))
+        player += (WIDTH / 2, HEIGHT / 2)
+        start = time.perf_counter()
+        scheduler.update(player)
+        enemies.update()
+        frame_times.append(time.perf_counter() - start)
+        think_times.append(scheduler.elapsed)
+        thoughts.append(scheduler.thoughts)
+    return think_times, frame_times, thoughts
+
+
+def _percentile(values, ratio):
+    """Retourne le centile ratio d'une liste de valeurs."""
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def main(frames=300, budget=0.004, frame_budget=FRAME_BUDGET):
+    """Affiche les temps de frame pour un nombre croissant d'agents.
+
+    Retourne True si, pour chaque nombre d'agents, le 95e centile du temps de
+    décision tient dans budget et celui du temps de frame dans frame_budget.
+    """
+    print(
+        f"Budget de décision: {budget * 1000:.1f} ms par frame, "
+        f"budget de frame: {frame_budget * 1000:.1f} ms"
+    )
+    print(
+        f"{'agents':>7} {'décisions/frame':>16} {'IA moy.':>9} "
+        f"{'IA p95':>9} {'IA':>8} {'frame moy.':>11} {'frame p95':>10} "
+        f"{'frame':>8}"
+    )
+    worst_think = 0
+    think_passed = frame_passed = True
+    for count in AGENT_COUNTS:
+        think_times, frame_times, thoughts = run(count, frames, budget)
+        think_p95 = _percentile(think_times, 0.95)
+        frame_p95 = _percentile(frame_times, 0.95)
+        think_ok = think_p95 <= budget + BUDGET_TOLERANCE
+        frame_ok = frame_p95 <= frame_budget
+        worst_think = max(worst_think, think_p95)
+        think_passed = think_passed and think_ok
+        frame_passed = frame_passed and frame_ok
+        print(
+            f"{count:>7} {statistics.mean(thoughts):>16.1f} "
+            f"{statistics.mean(think_times) * 1000:>7.2f}ms "
+            f"{think_p95 * 1000:>7.2f}ms {_verdict(think_ok):>8} "
+            f"{statistics.mean(frame_times) * 1000:>9.2f}ms "
+            f"{frame_p95 * 1000:>8.2f}ms {_verdict(frame_ok):>8}"
+        )
+    print(
+        f"Temps de décision p95 maximal: {worst_think * 1000:.2f} ms pour un "
+        f"budget de {budget * 1000:.1f} ms: {_verdict(think_passed)}"
+    )
+    return think_passed and frame_passed
+
+
+def _verdict(passed):
+    """Retourne le résultat d'une vérification sous forme de texte."""
+    return "OK" if passed else "DÉPASSÉ"
+
+
+if __name__ == "__main__":
+    raise SystemExit(0 if main() else 1)
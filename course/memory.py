@@ -0,0 +1,288 @@
+"""Outil d'inspection de la mémoire utilisée par les exemples du cours.
+
+L'inspecteur parcourt les attributs d'un objet Game vivant pour totaliser la
+taille des pixels des surfaces (une seule fois par tampon mémoire sous-jacent),
+compter les sprites de chaque groupe et repérer les surfaces identiques
+chargées plusieurs fois. Le tas python est suivi à l'aide de tracemalloc, qui
+fournit le pic atteint au cours de la partie.
+
+Les pixels des surfaces sont alloués par SDL et non par python: ils
+n'apparaissent donc pas dans les mesures de tracemalloc et sont comptés à part,
+à chaque instantané.
+"""
+
+from contextlib import contextmanager
+import hashlib
+import time
+import tracemalloc
+
+import pygame as pg
+
+# Allocations de l'inspecteur lui-même, exclues des comparaisons. Le filtrage
+# compile et met en cache des motifs fnmatch: il n'a donc lieu qu'une fois les
+# deux instantanés tracemalloc pris.
+_FILTERS = [
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, __file__),
+]
+
+
+def _format_size(size):
+    """Retourne une taille en octets lisible par un humain."""
+    if abs(size) < 1024:
+        return f"{size} o"
+    for unit in ("Kio", "Mio"):
+        size /= 1024
+        if abs(size) < 1024:
+            return f"{size:.1f} {unit}"
+    return f"{size / 1024:.1f} Gio"
+
+
+class MemoryInspector:
+    """Mesure l'empreinte mémoire d'un jeu au cours d'une partie."""
+
+    def __init__(self, frames=1):
+        """Initialise l'inspecteur.
+
+        frames est le nombre de cadres de pile conservés par tracemalloc pour
+        chaque allocation. Le rapport regroupant les allocations par ligne, un
+        seul cadre suffit.
+        """
+        self.frames = frames
+        self.snapshots = []
+        self.peak = 0
+        # Mémoire python occupée par l'inspecteur, retirée des mesures
+        self._overhead = 0
+        self._baseline = None
+        self._final = None
+        # Tampons du premier et du dernier instantané, pour le détail du rapport
+        self._first_buffers = None
+        self._last_buffers = None
+
+    def start(self):
+        """Démarre le suivi des allocations python."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.frames)
+
+    def stop(self):
+        """Arrête le suivi des allocations python."""
+        if tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            self.peak = max(self.peak, peak - self._overhead)
+            self._final = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            if self._baseline is not None:
+                self._baseline = self._baseline.filter_traces(_FILTERS)
+            self._final = self._final.filter_traces(_FILTERS)
+
+    def snapshot(self, game, label):
+        """Prend un instantané de la mémoire du jeu, repéré par label."""
+        current, peak = tracemalloc.get_traced_memory()
+        self.peak = max(self.peak, peak - self._overhead)
+
+        # Les surfaces ne sont pas conservées: l'inspecteur ne doit pas
+        # empêcher le jeu de libérer celles qu'il remplace.
+        buffers = [
+            self._describe(entry) for entry in self.surfaces(game).values()
+        ]
+        self.snapshots.append({
+            "label": label,
+            "python": current - self._overhead,
+            "pixels": sum(entry["size"] for entry in buffers),
+            "buffers": len(buffers),
+            "groups": self.groups(game),
+        })
+        if self._first_buffers is None:
+            self._first_buffers = buffers
+            self._baseline = tracemalloc.take_snapshot()
+        else:
+            self._last_buffers = buffers
+
+        # Tout ce qui vient d'être alloué appartient à l'inspecteur
+        self._overhead += tracemalloc.get_traced_memory()[0] - current
+        # reset_peak n'existe qu'à partir de python 3.9: sans lui, le pic
+        # peut inclure la mémoire temporaire de take_snapshot().
+        if hasattr(tracemalloc, "reset_peak"):
+            tracemalloc.reset_peak()
+
+    @contextmanager
+    def watch(self, game, interval=5.0):
+        """Prend un instantané toutes les interval secondes pendant la partie.
+
+        Les instantanés sont pris lors des rafraîchissements de l'affichage:
+        pg.display.update et pg.display.flip sont remplacées le temps du bloc
+        with. Un jeu dont la boucle ne rafraîchit pas l'affichage, comme ceux
+        du chapitre 2, n'est donc relevé qu'au début et à la fin.
+        """
+        update, flip = pg.display.update, pg.display.flip
+        start = last = time.perf_counter()
+
+        def watched(function):
+            def refresh(*args):
+                nonlocal last
+                function(*args)
+                now = time.perf_counter()
+                if now - last >= interval:
+                    last = now
+                    self.snapshot(game, f"{now - start:.0f} s")
+            return refresh
+
+        pg.display.update, pg.display.flip = watched(update), watched(flip)
+        try:
+            yield self
+        finally:
+            pg.display.update, pg.display.flip = update, flip
+
+    def surfaces(self, game):
+        """Retourne les surfaces atteignables depuis le jeu.
+
+        Le résultat est un dictionnaire associant à chaque tampon de pixels la
+        liste des chemins d'attributs qui y mènent et sa taille en octets. Les
+        sous-surfaces partagent le tampon de leur surface parente.
+        """
+        buffers = {}
+        for path, surface in self._walk_surfaces(game):
+            parent = surface.get_abs_parent()
+            key = self._buffer_address(parent)
+            entry = buffers.setdefault(key, {
+                "surface": parent,
+                "size": parent.get_pitch() * parent.get_height(),
+                "paths": [],
+            })
+            entry["paths"].append(path)
+        return buffers
+
+    def groups(self, game):
+        """Retourne le nombre de sprites de chaque groupe du jeu."""
+        return {
+            name: len(value)
+            for name, value in vars(game).items()
+            if isinstance(value, pg.sprite.AbstractGroup)
+        }
+
+    def duplicates(self, buffers):
+        """Retourne les groupes de tampons distincts aux pixels identiques.
+
+        buffers est la liste des tampons décrits lors d'un instantané.
+        """
+        contents = {}
+        for entry in buffers:
+            key = (entry["width"], entry["height"], entry["bitsize"],
+                   entry["digest"])
+            contents.setdefault(key, []).append(entry)
+        return [entries for entries in contents.values() if len(entries) > 1]
+
+    def changes(self, limit=10):
+        """Retourne les plus fortes évolutions du tas python depuis le premier
+        instantané, une fois l'inspecteur arrêté.
+        """
+        if self._baseline is None or self._final is None:
+            return []
+        return self._final.compare_to(self._baseline, "lineno")[:limit]
+
+    def report(self, limit=10):
+        """Retourne le rapport mémoire sous forme de texte."""
+        lines = ["Rapport mémoire", "==============="]
+        if not self.snapshots:
+            return "\n".join(lines)
+
+        first, last = self.snapshots[0], self.snapshots[-1]
+        details = [(first, self._first_buffers)]
+        if self._last_buffers is not None:
+            details.append((last, self._last_buffers))
+        for snapshot, buffers in details:
+            lines.append("")
+            lines.append(f"[{snapshot['label']}]")
+            lines.append(f"  Tas python: {_format_size(snapshot['python'])}")
+            lines.append(
+                f"  Pixels des surfaces: {_format_size(snapshot['pixels'])} "
+                f"({snapshot['buffers']} tampons)"
+            )
+            for entry in sorted(
+                buffers, key=lambda entry: entry["size"], reverse=True
+            ):
+                lines.append(
+                    f"    {_format_size(entry['size']):>10}  "
+                    f"{entry['width']}x{entry['height']}  "
+                    f"{', '.join(entry['paths'][:3])}"
+                    + (" ..." if len(entry["paths"]) > 3 else "")
+                )
+            for name, count in snapshot["groups"].items():
+                lines.append(f"  Groupe {name}: {count} sprites")
+            for entries in self.duplicates(buffers):
+                wasted = sum(entry["size"] for entry in entries[1:])
+                paths = ", ".join(entry["paths"][0] for entry in entries[:3])
+                lines.append(
+                    f"  Doublon: {len(entries)} surfaces identiques "
+                    f"({_format_size(wasted)} gaspillés): {paths}"
+                )
+
+        lines.append("")
+        lines.append("Évolution au cours de la partie:")
+        for snapshot in self.snapshots:
+            sprites = sum(snapshot["groups"].values())
+            lines.append(
+                f"  {snapshot['label']:>16}  "
+                f"tas {_format_size(snapshot['python']):>10}  "
+                f"pixels {_format_size(snapshot['pixels']):>10}  "
+                f"{sprites} sprites"
+            )
+
+        heaviest = max(self.snapshots, key=lambda snapshot: snapshot["pixels"])
+        lines.append("")
+        lines.append(f"Pic du tas python: {_format_size(self.peak)}")
+        lines.append(
+            f"Pic des pixels des surfaces: "
+            f"{_format_size(heaviest['pixels'])} [{heaviest['label']}]"
+        )
+
+        changes = self.changes(limit)
+        if changes:
+            lines.append(f"Plus fortes évolutions depuis [{first['label']}]:")
+            for stat in changes:
+                lines.append(f"  {stat}")
+
+        return "\n".join(lines)
+
+    def _walk_surfaces(self, game):
+        """Génère les couples (chemin, surface) atteignables depuis le jeu."""
+        for name, value in vars(game).items():
+            if isinstance(value, pg.Surface):
+                yield name, value
+            elif isinstance(value, pg.sprite.Sprite):
+                yield from self._sprite_surfaces(name, value)
+            elif isinstance(value, pg.sprite.AbstractGroup):
+                for index, sprite in enumerate(value.sprites()):
+                    yield from self._sprite_surfaces(
+                        f"{name}[{index}]", sprite
+                    )
+
+    @staticmethod
+    def _describe(entry):
+        """Résume un tampon de pixels sans conserver la surface."""
+        surface = entry["surface"]
+        width, height = surface.get_size()
+        return {
+            "size": entry["size"],
+            "width": width,
+            "height": height,
+            "pitch": surface.get_pitch(),
+            "bitsize": surface.get_bitsize(),
+            "paths": entry["paths"],
+            "digest": hashlib.blake2b(
+                surface.get_buffer().raw, digest_size=16
+            ).hexdigest(),
+        }
+
+    @staticmethod
+    def _sprite_surfaces(path, sprite):
+        """Génère les surfaces portées par une sprite."""
+        for name, value in vars(sprite).items():
+            if isinstance(value, pg.Surface):
+                yield f"{path}.{name}", value
+
+    @staticmethod
+    def _buffer_address(surface):
+        """Retourne l'adresse du tampon de pixels d'une surface."""
+        # _pixels_address n'existe qu'à partir de pygame 2
+        return getattr(surface, "_pixels_address", id(surface))
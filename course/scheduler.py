@@ -0,0 +1,167 @@
+"""Ordonnanceur d'intelligence artificielle pour les ennemis du jeu.
+
+Faire réfléchir chaque ennemi à chaque appel de Group.update() devient vite
+trop coûteux lorsque leur nombre augmente. L'ordonnanceur répartit donc les
+décisions sur plusieurs frames:
+
+- chaque frame dispose d'un budget de temps à ne pas dépasser;
+- les agents proches du joueur sont rangés dans des paliers prioritaires et
+  réfléchissent plus souvent que les agents éloignés;
+- chaque palier est parcouru en tourniquet (round-robin) afin qu'aucun agent
+  ne soit oublié, et chaque palier non vide est servi au moins une fois par
+  frame.
+
+Entre deux décisions, la méthode update() des agents se contente de les
+déplacer vers leur dernière cible, ce qui reste très bon marché.
+"""
+
+import abc
+from bisect import bisect
+from collections import deque
+from itertools import cycle
+import time
+
+import pygame as pg
+
+
+class Agent(abc.ABC, pg.sprite.Sprite):
+    """Représente une sprite dont les décisions sont prises par l'IA."""
+
+    # Vitesse de déplacement en pixels par frame
+    speed = 2
+
+    def __init__(self, position, size=(30, 30)):
+        """Initialise l'agent à la position donnée."""
+        super().__init__()
+        self.position = pg.math.Vector2(position)
+        # Point vers lequel l'agent se déplace entre deux décisions
+        self.target = pg.math.Vector2(position)
+        self.rect = pg.Rect((0, 0), size)
+        self.rect.center = round(self.position.x), round(self.position.y)
+
+    @abc.abstractmethod
+    def think(self, player):
+        """Prend une décision en fonction de la position du joueur.
+
+        Cette méthode, coûteuse, est appelée par l'ordonnanceur et doit mettre
+        à jour l'attribut target.
+        """
+
+    def update(self, *args):
+        """Rapproche l'agent de sa cible sans prendre de décision."""
+        direction = self.target - self.position
+        distance = direction.length()
+        if distance <= self.speed:
+            self.position.update(self.target)
+        else:
+            self.position += direction * (self.speed / distance)
+        self.rect.center = round(self.position.x), round(self.position.y)
+
+
+class AgentScheduler:
+    """Répartit les décisions des agents sur plusieurs frames."""
+
+    def __init__(self, budget=0.004, tiers=(150, 400), weights=(4, 2, 1)):
+        """Initialise l'ordonnanceur.
+
+        budget est le temps maximal, en secondes, consacré aux décisions à
+        chaque frame. tiers contient les distances au joueur, en pixels,
+        séparant les paliers de priorité et weights le nombre de décisions
+        accordées à chaque palier à chaque tour du tourniquet.
+        """
+        if len(weights) != len(tiers) + 1:
+            raise ValueError("weights doit contenir un poids de plus que tiers")
+        if any(weight <= 0 for weight in weights):
+            raise ValueError("les poids de weights doivent être positifs")
+        if list(tiers) != sorted(tiers):
+            raise ValueError("tiers doit être trié par distance croissante")
+        self.budget = budget
+        self.tiers = tuple(tiers)
+        self._queues = [deque() for _ in weights]
+        self._order = cycle([
+            tier for tier, weight in enumerate(weights) for _ in range(weight)
+        ])
+        # Agents gérés par l'ordonnanceur
+        self._agents = set()
+        # Numéro de la dernière frame pendant laquelle chaque agent présent
+        # dans une file a réfléchi, y compris les agents retirés depuis
+        self._frames = {}
+        self._frame = 0
+        # Statistiques de la dernière frame
+        self.thoughts = 0
+        self.elapsed = 0.0
+
+    def __len__(self):
+        """Retourne le nombre d'agents gérés par l'ordonnanceur."""
+        return len(self._agents)
+
+    def add(self, *agents):
+        """Ajoute des agents, qui réfléchiront dès que possible.
+
+        Les agents doivent appartenir à un groupe: ceux qui en sont retirés,
+        par exemple avec kill(), sont oubliés par l'ordonnanceur.
+        """
+        for agent in agents:
+            self._agents.add(agent)
+            # Un agent retiré puis rajouté est peut-être encore dans une file
+            if agent not in self._frames:
+                self._frames[agent] = -1
+                self._queues[0].append(agent)
+
+    def remove(self, *agents):
+        """Retire des agents de l'ordonnanceur."""
+        # Les agents retirés sont ignorés lorsqu'ils sortent de leur file
+        for agent in agents:
+            self._agents.discard(agent)
+
+    def update(self, player):
+        """Fait réfléchir autant d'agents que le budget de la frame le permet.
+
+        player est la position du joueur. Un agent réfléchit au plus une fois
+        par frame.
+        """
+        start = time.perf_counter()
+        deadline = start + self.budget
+        self._frame += 1
+        self.thoughts = 0
+        player = pg.math.Vector2(player)
+
+        # Chaque palier non vide est servi au moins une fois pour éviter
+        # que les agents éloignés ne soient jamais mis à jour.
+        pending = set()
+        for tier, queue in enumerate(self._queues):
+            if self._think_next(queue, player):
+                pending.add(tier)
+
+        while pending and time.perf_counter() < deadline:
+            tier = next(self._order)
+            if tier in pending and not self._think_next(
+                self._queues[tier], player
+            ):
+                pending.discard(tier)
+
+        self.elapsed = time.perf_counter() - start
+
+    def _think_next(self, queue, player):
+        """Fait réfléchir le prochain agent de la file.
+
+        Retourne False lorsque la file ne contient plus d'agent pouvant
+        réfléchir pendant cette frame.
+        """
+        while queue:
+            agent = queue.popleft()
+            if agent not in self._agents or not agent.alive():
+                self._agents.discard(agent)
+                del self._frames[agent]
+                continue
+            if self._frames[agent] == self._frame:
+                queue.appendleft(agent)
+                return False
+            agent.think(player)
+            self._frames[agent] = self._frame
+            self.thoughts += 1
+            # L'agent rejoint la file correspondant à sa nouvelle distance
+            tier = bisect(self.tiers, agent.position.distance_to(player))
+            self._queues[tier].append(agent)
+            return True
+        return False
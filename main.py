@@ -3,24 +3,55 @@ from importlib import import_module
 import click
 
 
+def run(name, mem_report):
+    module = import_module(name)
+    if not mem_report:
+        module.main()
+        return
+
+    memory = import_module('course.memory')
+    inspector = memory.MemoryInspector()
+    inspector.start()
+    game = module.Game()
+    inspector.snapshot(game, 'initialisation')
+    try:
+        with inspector.watch(game):
+            game.start()
+    except KeyboardInterrupt:
+        pass
+    inspector.snapshot(game, 'fin de partie')
+    inspector.stop()
+    click.echo(inspector.report())
+
+
 @click.group()
 def cli():
     pass
 
 @click.command()
 @click.option('--iteration', default=3, help="Start modules from chapter 2")
-def chapter2(iteration):
-    module = import_module(f'course.chapter2.example.iteration{iteration}')
-    module.main()
+@click.option('--mem-report', is_flag=True, help="Print a memory report")
+def chapter2(iteration, mem_report):
+    run(f'course.chapter2.example.iteration{iteration}', mem_report)
 
 @click.command()
 @click.option('--iteration', default=5, help="Start modules from chapter 3")
-def chapter3(iteration):
-    module = import_module(f'course.chapter3.example.iteration{iteration}')
-    module.main()
+@click.option('--mem-report', is_flag=True, help="Print a memory report")
+def chapter3(iteration, mem_report):
+    run(f'course.chapter3.example.iteration{iteration}', mem_report)
+
+@click.command()
+@click.option('--frames', default=300, help="Frames simulated for each agent count")
+@click.option('--budget', default=4.0, help="AI time budget per frame in ms")
+@click.option('--frame-budget', default=1000 / 30, help="Frame time budget in ms")
+def benchmark(frames, budget, frame_budget):
+    module = import_module('course.benchmark')
+    if not module.main(frames, budget / 1000, frame_budget / 1000):
+        raise click.ClickException("Frame time exceeds the frame budget")
 
 cli.add_command(chapter2)
 cli.add_command(chapter3)
+cli.add_command(benchmark)
 
 if __name__ == "__main__":
     cli()
\ No newline at end of file
@@ -0,0 +1,109 @@
+import fnmatch
+import os
+import re
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame as pg
+import pytest
+
+from course.memory import MemoryInspector
+
+
+class Game:
+    """Jeu minimal dont les attributs sont parcourus par l'inspecteur."""
+
+    def __init__(self):
+        self.background = pg.Surface((20, 10), depth=32)
+        self.tile = self.background.subsurface((0, 0, 5, 5))
+        self.sprites = pg.sprite.Group()
+        self.walls = pg.sprite.Group()
+        for _ in range(2):
+            sprite = pg.sprite.Sprite(self.sprites)
+            sprite.image = pg.Surface((10, 10), depth=32)
+            sprite.image.fill((255, 0, 0))
+        self.walls.add(pg.sprite.Sprite())
+
+
+@pytest.fixture
+def inspector():
+    inspector = MemoryInspector()
+    inspector.start()
+    yield inspector
+    inspector.stop()
+
+
+def test_subsurface_shares_its_parent_buffer(inspector):
+    game = Game()
+
+    buffers = inspector.surfaces(game)
+
+    entry, = [
+        entry for entry in buffers.values() if "background" in entry["paths"]
+    ]
+    assert entry["paths"] == ["background", "tile"]
+    assert entry["size"] == game.background.get_pitch() * 10
+    assert len(buffers) == 3
+
+
+def test_identical_surfaces_are_reported_as_duplicates(inspector):
+    game = Game()
+
+    inspector.snapshot(game, "initialisation")
+    inspector.stop()
+
+    # Deux images rouges de 10x10 pixels sur 32 bits: 400 octets gaspillés
+    assert (
+        "Doublon: 2 surfaces identiques (400 o gaspillés): "
+        "sprites[0].image, sprites[1].image"
+    ) in inspector.report()
+
+
+def test_duplicates_use_pixels_at_snapshot_time(inspector):
+    game = Game()
+
+    inspector.snapshot(game, "initialisation")
+    game.sprites.sprites()[0].image.fill((0, 0, 255))
+    inspector.snapshot(game, "fin de partie")
+    inspector.stop()
+
+    assert inspector.report().count("Doublon") == 1
+
+
+def test_groups_count_sprites(inspector):
+    assert inspector.groups(Game()) == {"sprites": 2, "walls": 1}
+
+
+def test_watch_restores_display_functions(inspector):
+    update, flip = pg.display.update, pg.display.flip
+
+    with inspector.watch(Game()):
+        assert pg.display.update is not update
+    with pytest.raises(RuntimeError):
+        with inspector.watch(Game()):
+            raise RuntimeError
+
+    assert pg.display.update is update
+    assert pg.display.flip is flip
+
+
+def test_changes_exclude_the_inspector(inspector):
+    # Les motifs des filtres doivent être recompilés pendant ce test
+    re.purge()
+    fnmatch._compile_pattern.cache_clear()
+    game = Game()
+
+    inspector.snapshot(game, "initialisation")
+    game.data = [bytes(1000) for _ in range(100)]
+    inspector.snapshot(game, "fin de partie")
+    inspector.stop()
+
+    filenames = [
+        stat.traceback[0].filename for stat in inspector.changes(limit=None)
+    ]
+    assert any(filename == __file__ for filename in filenames)
+    for filename in filenames:
+        assert os.path.basename(filename) not in (
+            "memory.py", "tracemalloc.py", "fnmatch.py"
+        )
+        assert os.sep + "re" + os.sep not in filename
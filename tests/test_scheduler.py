@@ -0,0 +1,113 @@
+import itertools
+
+import pygame as pg
+import pytest
+
+from course.scheduler import Agent, AgentScheduler
+
+PLAYER = (0, 0)
+
+
+class CountingAgent(Agent):
+    """Agent qui compte ses décisions."""
+
+    def __init__(self, position):
+        super().__init__(position)
+        self.thoughts = 0
+
+    def think(self, player):
+        self.thoughts += 1
+
+
+def create(scheduler, *positions):
+    group = pg.sprite.Group()
+    agents = [CountingAgent(position) for position in positions]
+    group.add(*agents)
+    scheduler.add(*agents)
+    return group, agents
+
+
+def test_agent_without_think_cannot_be_created():
+    class Lazy(Agent):
+        pass
+
+    with pytest.raises(TypeError):
+        Lazy(PLAYER)
+
+
+@pytest.mark.parametrize("options", [
+    {"weights": (4, 0, 1)},
+    {"weights": (0, 0, 0)},
+    {"tiers": (400, 150)},
+    {"tiers": (150,)},
+])
+def test_invalid_options_are_rejected(options):
+    with pytest.raises(ValueError):
+        AgentScheduler(**options)
+
+
+def test_agents_think_at_most_once_per_frame():
+    scheduler = AgentScheduler(budget=1)
+    _, agents = create(scheduler, (10, 10), (200, 0), (1000, 0))
+
+    for _ in range(5):
+        scheduler.update(PLAYER)
+        assert scheduler.thoughts == 3
+
+    assert [agent.thoughts for agent in agents] == [5, 5, 5]
+
+
+def test_far_agents_are_not_starved():
+    # Sans budget, chaque palier non vide n'est servi qu'une fois par frame
+    scheduler = AgentScheduler(budget=0)
+    _, agents = create(scheduler, *[(10, 10)] * 50, (1000, 0))
+    far = agents[-1]
+
+    for _ in range(100):
+        scheduler.update(PLAYER)
+
+    assert far.thoughts == 50
+    assert all(agent.thoughts >= 1 for agent in agents[:-1])
+
+
+def test_killed_agents_are_dropped():
+    scheduler = AgentScheduler(budget=1)
+    _, (killed, alive) = create(scheduler, (10, 10), (20, 20))
+
+    scheduler.update(PLAYER)
+    killed.kill()
+    scheduler.update(PLAYER)
+    scheduler.update(PLAYER)
+
+    assert len(scheduler) == 1
+    assert killed.thoughts == 1
+    assert alive.thoughts == 3
+
+
+def test_removed_then_added_agent_is_queued_once():
+    scheduler = AgentScheduler(budget=1)
+    _, (first, second) = create(scheduler, (10, 10), (20, 20))
+    for _ in range(3):
+        scheduler.remove(first)
+        scheduler.add(first)
+
+    for frame in range(1, 11):
+        scheduler.update(PLAYER)
+        assert scheduler.thoughts == 2
+        assert first.thoughts == second.thoughts == frame
+
+
+def test_budget_stops_the_frame(mocker):
+    # Chaque lecture de l'horloge avance d'une milliseconde
+    mocker.patch(
+        "course.scheduler.time.perf_counter",
+        side_effect=itertools.count(0, 0.001),
+    )
+    scheduler = AgentScheduler(budget=0.0035)
+    _, agents = create(scheduler, *[(10, 10)] * 100)
+
+    scheduler.update(PLAYER)
+
+    # Une décision garantie au palier puis trois avant la fin du budget
+    assert scheduler.thoughts == 4
+    assert sum(agent.thoughts for agent in agents) == 4